@@ -1,4 +1,4 @@
-from .format_validator import validate_formats
+from .format_validator import Finding, validate_formats, validate_formats_parallel
 
 # As you add more analysis modules (e.g., source_auditor.py),
 # you can import their main functions here for easier access from main.py:
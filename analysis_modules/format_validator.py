@@ -1,202 +1,367 @@
+import concurrent.futures
 import datetime
+import functools
 import re
 import os
 import sys # For standalone testing path adjustments
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+
+# Precompiled date-shape patterns. These used to be rebuilt via re.match on
+# every call, which showed up prominently when profiling large GEDCOM files.
+_BET_RE = re.compile(r"BET\s+(.*)\s+AND\s+(.*)", re.IGNORECASE)
+_PREFIX_RE = re.compile(r"^(ABT|CAL|EST|INT|BEF|AFT|FROM|TO)\s+", re.IGNORECASE)
+
+# Shape sniffer for the common GEDCOM date forms, as one combined alternation:
+# a single C-level match classifies the string, and the winning named group
+# tells us which strptime format (if any) can possibly apply.
+_SHAPE_RE = re.compile(
+    r"(?P<dmy>\d{1,2} [A-Za-z]{3} \d{4}$)"
+    r"|(?P<ymd>\d{4}-\d{1,2}-\d{1,2}$)"
+    r"|(?P<mon_y>[A-Za-z]{3} \d{4}$)"
+    r"|(?P<y>\d{4}$)"
+    r"|(?P<dmy_slash>\d{1,2}/\d{1,2}/\d{4}$)")
+_SHAPE_GROUP_FORMATS = {
+    "dmy": "%d %b %Y",
+    "ymd": "%Y-%m-%d",
+    "mon_y": "%b %Y",
+    "y": "%Y",
+    "dmy_slash": "%d/%m/%Y",
+}
+
+# Month abbreviation -> maximum day, doubling as the valid-month set.
+_MONTH_MAX_DAYS = {
+    "JAN": 31, "FEB": 29, "MAR": 31, "APR": 30, "MAY": 31, "JUN": 30,
+    "JUL": 31, "AUG": 31, "SEP": 30, "OCT": 31, "NOV": 30, "DEC": 31,
+}
+_DAYS_IN_MONTH = (31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _is_leap_year(year: int) -> bool:
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+# Specialized validators for each recognized shape. We only need to know
+# whether a date is *valid*, so these skip strptime's format parsing, locale
+# lookup and datetime construction; the shape regex has already guaranteed
+# the field layout, leaving just the range checks.
+def _validate_dmy(s: str) -> bool:
+    """Validity of 'DD MON YYYY'; matches strptime including leap years."""
+    day_s, mon_s, year_s = s.split(" ")
+    if year_s == "0000": # strptime rejects year 0 (datetime.MINYEAR == 1)
+        return False
+    max_day = _MONTH_MAX_DAYS.get(mon_s.upper())
+    if max_day is None:
+        return False
+    day = int(day_s)
+    if not 1 <= day <= max_day:
+        return False
+    if day == 29 and max_day == 29: # 29 FEB only exists in leap years
+        return _is_leap_year(int(year_s))
+    return True
+
+
+def _validate_ymd(s: str) -> bool:
+    """Validity of 'YYYY-MM-DD'."""
+    year_s, mon_s, day_s = s.split("-")
+    if year_s == "0000": # strptime rejects year 0
+        return False
+    mon = int(mon_s)
+    if not 1 <= mon <= 12:
+        return False
+    day = int(day_s)
+    if not 1 <= day <= _DAYS_IN_MONTH[mon - 1]:
+        return False
+    if mon == 2 and day == 29:
+        return _is_leap_year(int(year_s))
+    return True
+
+
+def _validate_dmy_slash(s: str) -> bool:
+    """Validity of 'DD/MM/YYYY'."""
+    day_s, mon_s, year_s = s.split("/")
+    if year_s == "0000": # strptime rejects year 0
+        return False
+    mon = int(mon_s)
+    if not 1 <= mon <= 12:
+        return False
+    day = int(day_s)
+    if not 1 <= day <= _DAYS_IN_MONTH[mon - 1]:
+        return False
+    if mon == 2 and day == 29:
+        return _is_leap_year(int(year_s))
+    return True
+
+
+def _validate_mon_y(s: str) -> bool:
+    """Validity of 'MON YYYY'."""
+    mon_s, year_s = s.split(" ")
+    return year_s != "0000" and mon_s.upper() in _MONTH_MAX_DAYS
+
+
+def _validate_y(s: str) -> bool:
+    """Validity of 'YYYY' (the shape regex already guarantees four digits)."""
+    return s != "0000" # strptime rejects year 0
+
+
+_SHAPE_VALIDATORS = {
+    "dmy": _validate_dmy,
+    "ymd": _validate_ymd,
+    "mon_y": _validate_mon_y,
+    "y": _validate_y,
+    "dmy_slash": _validate_dmy_slash,
+}
+
+# Event tags whose DATE/PLAC children get format-checked, per record type.
+_INDI_EVENT_TAGS = frozenset({"BIRT", "DEAT", "CHR", "ADOP", "BURI", "EVEN"})
+_FAM_EVENT_TAGS = frozenset({"MARR", "DIV", "ANUL", "ENGA", "EVEN"})
+
+# Interned constants for the fields every finding repeats: thousands of
+# findings then share one string object apiece instead of fresh copies.
+_IT_FORMAT_ERROR = sys.intern("Format Error")
+_RT_INDIVIDUAL = sys.intern("Individual")
+_RT_EVENT_INDI = sys.intern("Event (Individual)")
+_RT_EVENT_FAM = sys.intern("Event (Family)")
+
+# --- Standardized issue record ---
+@dataclass(slots=True)
+class Finding:
+    """A single data-quality issue found during analysis.
+
+    Slotted so that large runs (tens of thousands of findings) pay a fixed
+    per-object cost instead of a dict per finding.
+    """
+    issue_type: str
+    record_type: str
+    element_xref_id: str
+    element_tag_path: str
+    problematic_value: str
+    message: str
+    rule_violated: str | None = None
+    suggestion: str | None = None
 
-# --- Helper function to create standardized issue dictionaries ---
-def _create_finding(issue_type, record_type, element_xref_id, element_tag_path, problematic_value, message, rule_violated=None, suggestion=None):
-    """Helper function to create a standardized finding dictionary."""
-    finding = {
-        "issue_type": issue_type,
-        "record_type": record_type,
-        "element_xref_id": element_xref_id,
-        "element_tag_path": element_tag_path,
-        "problematic_value": problematic_value,
-        "message": message
-    }
-    if rule_violated:
-        finding["rule_violated"] = rule_violated
-    if suggestion:
-        finding["suggestion"] = suggestion
-    return finding
 
 # --- Date Validation Logic ---
-def _is_date_parsable(single_date_str, preferred_formats):
-    """Attempts to parse a single date component against preferred formats."""
+@functools.lru_cache(maxsize=8192)
+def _is_date_parsable(single_date_str: str, preferred_formats: tuple[str, ...]) -> bool:
+    """Attempts to parse a single date component against preferred formats.
+
+    Results are memoized: the same date values (e.g. a shared BIRT year)
+    recur constantly across a GEDCOM, so repeats become O(1) cache hits.
+    `preferred_formats` must be hashable (a tuple) for the cache key.
+    """
     if not single_date_str:
         return False
+    single_date_str = single_date_str.strip()
+
+    # Fast path: one combined match classifies the string's shape, then a
+    # hand-rolled range check replaces strptime entirely. A failed check must
+    # NOT short-circuit to invalid: another configured format can share the
+    # shape and still accept the string (e.g. "01/13/1900" fails the
+    # day-first %d/%m/%Y check but parses under %m/%d/%Y), so it falls
+    # through to the exhaustive loop; only a pass is conclusive.
+    shape_match = _SHAPE_RE.match(single_date_str)
+    if shape_match:
+        group = shape_match.lastgroup
+        if _SHAPE_GROUP_FORMATS[group] in preferred_formats \
+                and _SHAPE_VALIDATORS[group](single_date_str):
+            return True
+
+    # Failed, ambiguous or unrecognized shape: fall back to the exhaustive loop.
     for fmt in preferred_formats:
         try:
-            datetime.datetime.strptime(single_date_str.strip(), fmt)
+            datetime.datetime.strptime(single_date_str, fmt)
             return True
         except ValueError:
             continue
     return False
 
-def _validate_date_value(date_str, preferred_formats):
+def _validate_date_value(date_str: str, preferred_formats: Sequence[str]) -> bool:
     """
     Validates a date string against a list of preferred formats.
     Handles common GEDCOM date qualifiers and "BET...AND..." ranges.
     Returns True if valid, False otherwise.
     """
     if not date_str: # An empty date string itself is not a format error for this validator
-        return True 
+        return True
 
-    original_date_str_upper = date_str.upper()
-    # Use original_date_str for re.match to preserve case for group extraction if needed, though IGNORECASE is used
-    cleaned_date_str = date_str # Will be modified if prefixes are stripped
+    # Tuple-ize so the memoized _is_date_parsable gets a hashable key;
+    # validate_formats already passes a tuple, so this is a near-noop there.
+    preferred_formats = tuple(preferred_formats)
 
     # Handle "BET <date1> AND <date2>"
-    if original_date_str_upper.startswith("BET ") and " AND " in original_date_str_upper:
-        try:
-            # Regex to capture date1 and date2 from "BET date1 AND date2"
-            match = re.match(r"BET (.*) AND (.*)", date_str, re.IGNORECASE)
-            if match:
-                date1_str = match.group(1).strip()
-                date2_str = match.group(2).strip()
-                # Validate each part of the BET...AND date.
-                if _is_date_parsable(date1_str, preferred_formats) and \
-                   _is_date_parsable(date2_str, preferred_formats):
-                    return True
-                else: # One or both parts of BET...AND are not parsable
-                    return False 
-            else: # Regex didn't match the expected BET...AND structure (e.g. "BET date1AND date2")
-                return False
-        except Exception: # Broad catch for any error during BET...AND parsing
-            return False
-
-
-    # Strip common prefixes for single dates or BEF/AFT/ABT etc. dates
-    prefixes_to_strip = ["ABT ", "CAL ", "EST ", "INT ", "BEF ", "AFT ", "FROM ", "TO "]
-    # Check original_date_str_upper for prefix, but strip from date_str to maintain original case for parsing
-    prefix_found = False
-    for prefix in prefixes_to_strip:
-        if original_date_str_upper.startswith(prefix):
-            cleaned_date_str = date_str[len(prefix):]
-            prefix_found = True
-            break 
-
-    # Attempt to parse the (potentially cleaned) date string
-    if _is_date_parsable(cleaned_date_str, preferred_formats):
-        return True
-        
+    bet_match = _BET_RE.match(date_str)
+    if bet_match:
+        # Validate each part of the BET...AND date.
+        return _is_date_parsable(bet_match.group(1).strip(), preferred_formats) and \
+               _is_date_parsable(bet_match.group(2).strip(), preferred_formats)
+
+    # Strip common prefixes (ABT, BEF, AFT, etc.) for qualified single dates
+    prefix_match = _PREFIX_RE.match(date_str)
+    cleaned_date_str = date_str[prefix_match.end():] if prefix_match else date_str
+
+    # Attempt to parse the (potentially cleaned) date string.
     # If a prefix was stripped AND it still failed, it's an error.
     # If no prefix was stripped AND it failed, it's an error.
-    return False
+    return _is_date_parsable(cleaned_date_str, preferred_formats)
 
-# --- Place Validation Logic ---
-def _validate_place_structure(place_str, expected_structures):
+# --- Main Validation Function ---
+def validate_formats(gedcom_reader, config: dict, only_record_ids: frozenset[str] | None = None) -> Iterator[Finding]:
     """
-    Validates a place string against expected comma-separated structures.
-    This is a basic heuristic check based on the number of comma-separated parts.
-    Returns True if it *could* match one of the structures or is empty, False otherwise.
+    Validates formats for names, dates, and places in the GEDCOM data,
+    yielding Finding objects as they are discovered so callers can stream
+    them instead of holding every issue in memory.
+
+    If only_record_ids is given, records whose id is not in that set are
+    skipped; validate_formats_parallel uses this to partition work.
     """
-    if not place_str: # An empty place string is not a format error
-        return True 
+    
+    # Tuple so the memoized date parser can use it as part of its cache key.
+    preferred_date_formats = tuple(config.get("preferred_date_formats", []))
+    expected_place_structures = config.get("expected_place_format_structures", [])
+    enforce_surname_slashes = config.get("name_validation_rules", {}).get("enforce_surname_slashes", True)
 
-    num_parts = len(place_str.split(','))
+    # Bind hot helpers to locals: the inner loops then use LOAD_FAST instead
+    # of LOAD_GLOBAL, which is measurable on large files.
+    Finding_ = Finding
+    _vd = _validate_date_value
 
-    for struct_str in expected_structures:
-        expected_num_parts = len(struct_str.split(','))
-        if num_parts == expected_num_parts:
-            return True 
-            
-    if num_parts == 1 and any(len(s.split(',')) == 1 for s in expected_structures):
-        return True
-        
-    return False
+    # The expected structures are constant for the whole run, so the place
+    # check reduces to a comma-count membership test against this set.
+    expected_place_part_counts = frozenset(
+        s.count(',') + 1 for s in expected_place_structures)
 
+    # The suggestion texts are the same for every finding; build them once
+    # instead of re-joining/re-splitting config values on each error. Also
+    # guards against an empty structures list, which used to IndexError.
+    date_formats_suggestion = (
+        f"Supported formats: {', '.join(preferred_date_formats)} "
+        "or GEDCOM date phrases (ABT, BEF, BET...AND...).")
+    if expected_place_structures:
+        place_structure_suggestion = (
+            f"Expected parts (by comma count): {expected_place_structures[0].count(',') + 1} "
+            f"for '{expected_place_structures[0]}' etc.")
+    else:
+        place_structure_suggestion = "No expected place structures configured."
 
-# --- Main Validation Function ---
-def validate_formats(gedcom_reader, config):
+    for record in gedcom_reader.records0():
+        top_tag = record.tag()
+        if top_tag == "INDI":
+            record_id = sys.intern(record.xref_id() or "UNKNOWN_INDI")
+            event_record_type = _RT_EVENT_INDI
+            event_tags = _INDI_EVENT_TAGS
+        elif top_tag == "FAM":
+            record_id = sys.intern(record.xref_id() or "UNKNOWN_FAM")
+            event_record_type = _RT_EVENT_FAM
+            event_tags = _FAM_EVENT_TAGS
+        else:
+            continue
+        if only_record_ids is not None and record_id not in only_record_ids:
+            continue
+        element_tag_path_base = f"{top_tag}:{record_id}"
+
+        # One pass over the record's children covers both the NAME check and
+        # the events; child_tag("NAME") would rescan the same child list.
+        name_checked = top_tag != "INDI" # only individual names are validated
+        for event_element in record.sub_tags():
+            event_tag = event_element.tag()
+
+            if event_tag == "NAME":
+                if name_checked: # mirror child_tag(): only the first NAME counts
+                    continue
+                name_checked = True
+                name_tag = event_element
+                name_value_raw = name_tag.value()
+                name_value_stripped = name_value_raw.strip()
+
+                if not name_value_stripped or name_value_stripped == '/' or name_value_stripped == '//':
+                    yield Finding_(
+                        _IT_FORMAT_ERROR, _RT_INDIVIDUAL, record_id, f"{element_tag_path_base}/NAME",
+                        name_value_raw, "Name is missing or appears to be empty.")
+                elif enforce_surname_slashes:
+                    parsed_surname = name_tag.surname()
+                    if not parsed_surname and "/" not in name_value_raw:
+                        yield Finding_(
+                            _IT_FORMAT_ERROR, _RT_INDIVIDUAL, record_id, f"{element_tag_path_base}/NAME", name_value_raw,
+                            "Name does not appear to use standard GEDCOM surname slashes (e.g., First /Surname/).",
+                            suggestion="Ensure surname is enclosed in slashes like /SURNAME/.")
+                    elif "/" in name_value_raw and not parsed_surname and name_value_raw.count("/") >= 2:
+                        # Slashes present, but couldn't parse surname (e.g. "Name / /")
+                        yield Finding_(
+                            _IT_FORMAT_ERROR, _RT_INDIVIDUAL, record_id, f"{element_tag_path_base}/NAME", name_value_raw,
+                            "Name contains slashes, but surname part might be empty or malformed (e.g., 'Name / /').",
+                            suggestion="Check surname formatting between slashes.")
+                continue
+
+            if event_tag not in event_tags:
+                continue
+
+            # Walrus bindings: fetch each tag value once instead of once to
+            # test truthiness and again to use it.
+            date_tag = event_element.child_tag("DATE")
+            if date_tag and (date_val := date_tag.value()) and (date_val := date_val.strip()) \
+                    and not _vd(date_val, preferred_date_formats):
+                yield Finding_(
+                    _IT_FORMAT_ERROR, event_record_type, record_id,
+                    f"{element_tag_path_base}/{event_tag}/DATE", date_val,
+                    f"Date format for {event_tag} ('{date_val}') invalid.", "preferred_date_formats",
+                    date_formats_suggestion)
+
+            place_tag = event_element.child_tag("PLAC")
+            if place_tag and (place_val := place_tag.value()) and (place_val := place_val.strip()) \
+                    and (place_val.count(',') + 1) not in expected_place_part_counts:
+                yield Finding_(
+                    _IT_FORMAT_ERROR, event_record_type, record_id,
+                    f"{element_tag_path_base}/{event_tag}/PLAC", place_val,
+                    f"Place format for {event_tag} ('{place_val}') does not match expected structures based on comma count.",
+                    "expected_place_format_structures",
+                    place_structure_suggestion)
+
+
+def _validate_chunk(gedcom_file_path: str, record_ids: Sequence[str], config: dict) -> list[Finding]:
+    """Worker for validate_formats_parallel.
+
+    Re-opens the GEDCOM file in-process (reader objects don't pickle) and
+    validates only the records whose ids are in record_ids. Materializes the
+    findings, since a generator cannot be sent back across processes.
+    """
+    from gedcom import GedcomReader
+    reader = GedcomReader(gedcom_file_path)
+    return list(validate_formats(reader, config, only_record_ids=frozenset(record_ids)))
+
+
+def validate_formats_parallel(gedcom_file_path: str, config: dict, max_workers: int | None = None) -> Iterator[Finding]:
     """
-    Validates formats for names, dates, and places in the GEDCOM data.
+    Runs validate_formats with the INDI/FAM records partitioned across worker
+    processes. Records are fully independent, so this scales with cores on
+    large files; each worker re-opens the GEDCOM and validates its own slice.
+
+    Falls back to the sequential path when there is nothing to split or only
+    one worker is requested. Yields the combined findings in chunk order.
     """
-    findings = []
-    
-    preferred_date_formats = config.get("preferred_date_formats", [])
-    expected_place_structures = config.get("expected_place_format_structures", [])
-    enforce_surname_slashes = config.get("name_validation_rules", {}).get("enforce_surname_slashes", True)
+    from gedcom import GedcomReader
+    reader = GedcomReader(gedcom_file_path)
+
+    # Collect record ids with the same UNKNOWN fallback validate_formats
+    # uses, deduplicated so anonymous records land in exactly one chunk.
+    record_ids = list(dict.fromkeys(
+        record.xref_id() or ("UNKNOWN_INDI" if record.tag() == "INDI" else "UNKNOWN_FAM")
+        for record in reader.records0() if record.tag() in ("INDI", "FAM")))
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    num_chunks = min(max_workers, len(record_ids))
+    if num_chunks <= 1:
+        yield from validate_formats(reader, config)
+        return
+
+    chunks = [record_ids[i::num_chunks] for i in range(num_chunks)]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=num_chunks) as executor:
+        futures = [executor.submit(_validate_chunk, gedcom_file_path, chunk, config)
+                   for chunk in chunks]
+        for future in futures: # in submission order, so output stays deterministic
+            yield from future.result()
 
-    for indi_element in gedcom_reader.records0("INDI"):
-        indi_id = indi_element.xref_id() if indi_element.xref_id() else "UNKNOWN_INDI"
-        element_tag_path_base = f"INDI:{indi_id}"
-
-        name_tag = indi_element.child_tag("NAME")
-        if name_tag:
-            name_value_raw = name_tag.value() 
-            name_value_stripped = name_value_raw.strip()
-
-            if not name_value_stripped or name_value_stripped == '/' or name_value_stripped == '//':
-                findings.append(_create_finding(
-                    "Format Error", "Individual", indi_id, f"{element_tag_path_base}/NAME", 
-                    name_value_raw, "Name is missing or appears to be empty."))
-            elif enforce_surname_slashes:
-                parsed_surname = name_tag.surname()
-                if not parsed_surname and "/" not in name_value_raw:
-                     findings.append(_create_finding(
-                        "Format Error", "Individual", indi_id, f"{element_tag_path_base}/NAME", name_value_raw,
-                        "Name does not appear to use standard GEDCOM surname slashes (e.g., First /Surname/).",
-                        suggestion="Ensure surname is enclosed in slashes like /SURNAME/."))
-                elif "/" in name_value_raw and not parsed_surname and name_value_raw.count("/") >= 2:
-                    # Slashes present, but couldn't parse surname (e.g. "Name / /")
-                    findings.append(_create_finding(
-                        "Format Error", "Individual", indi_id, f"{element_tag_path_base}/NAME", name_value_raw,
-                        "Name contains slashes, but surname part might be empty or malformed (e.g., 'Name / /').",
-                        suggestion="Check surname formatting between slashes."))
-        
-        event_tags_to_check = ["BIRT", "DEAT", "CHR", "ADOP", "BURI", "EVEN"] 
-        for event_tag_str in event_tags_to_check:
-            for event_element in indi_element.children_tags(event_tag_str):
-                event_path_base_specific = f"{element_tag_path_base}/{event_element.tag()}"
-                
-                date_tag = event_element.child_tag("DATE")
-                if date_tag and date_tag.value():
-                    date_val = date_tag.value().strip()
-                    if date_val and not _validate_date_value(date_val, preferred_date_formats):
-                        findings.append(_create_finding(
-                            "Format Error", "Event (Individual)", indi_id, f"{event_path_base_specific}/DATE", date_val,
-                            f"Date format for {event_element.tag()} ('{date_val}') invalid.", "preferred_date_formats",
-                            f"Supported formats: {', '.join(preferred_date_formats)} or GEDCOM date phrases (ABT, BEF, BET...AND...)."))
-
-                place_tag = event_element.child_tag("PLAC")
-                if place_tag and place_tag.value():
-                    place_val = place_tag.value().strip()
-                    if place_val and not _validate_place_structure(place_val, expected_place_structures):
-                        findings.append(_create_finding(
-                            "Format Error", "Event (Individual)", indi_id, f"{event_path_base_specific}/PLAC", place_val,
-                            f"Place format for {event_element.tag()} ('{place_val}') does not match expected structures based on comma count.",
-                            "expected_place_format_structures",
-                            f"Expected parts (by comma count): {len(expected_place_structures[0].split(','))} for '{expected_place_structures[0]}' etc."))
-                        
-    for fam_element in gedcom_reader.records0("FAM"):
-        fam_id = fam_element.xref_id() if fam_element.xref_id() else "UNKNOWN_FAM"
-        element_tag_path_base = f"FAM:{fam_id}"
-
-        family_event_tags_to_check = ["MARR", "DIV", "ANUL", "ENGA", "EVEN"]
-        for event_tag_str in family_event_tags_to_check:
-            for event_element in fam_element.children_tags(event_tag_str):
-                event_path_base_specific = f"{element_tag_path_base}/{event_element.tag()}"
-
-                date_tag = event_element.child_tag("DATE")
-                if date_tag and date_tag.value():
-                    date_val = date_tag.value().strip()
-                    if date_val and not _validate_date_value(date_val, preferred_date_formats):
-                        findings.append(_create_finding(
-                            "Format Error", "Event (Family)", fam_id, f"{event_path_base_specific}/DATE", date_val,
-                            f"Date format for {event_element.tag()} ('{date_val}') invalid.", "preferred_date_formats",
-                            f"Supported formats: {', '.join(preferred_date_formats)} or GEDCOM date phrases."))
-                
-                place_tag = event_element.child_tag("PLAC")
-                if place_tag and place_tag.value():
-                    place_val = place_tag.value().strip()
-                    if place_val and not _validate_place_structure(place_val, expected_place_structures):
-                        findings.append(_create_finding(
-                            "Format Error", "Event (Family)", fam_id, f"{event_path_base_specific}/PLAC", place_val,
-                            f"Place format for {event_element.tag()} ('{place_val}') does not match structures based on comma count.",
-                            "expected_place_format_structures",
-                            f"Expected parts (by comma count): {len(expected_place_structures[0].split(','))} for '{expected_place_structures[0]}' etc."))
-    return findings
 
 if __name__ == '__main__':
     print("--- Testing Format Validator Standalone ---")
@@ -263,11 +428,11 @@ if __name__ == '__main__':
 
     if gedcom_reader_for_test and config_for_test:
         print("\n--- Running Validation (Standalone Test) ---")
-        findings = validate_formats(gedcom_reader_for_test, config_for_test)
+        findings = list(validate_formats(gedcom_reader_for_test, config_for_test))
         if findings:
             print(f"\nFound {len(findings)} format issues in standalone test:")
             for i, finding in enumerate(findings):
-                print(f"  {i+1}. {finding['message']} (Value: '{finding['problematic_value']}' at {finding['element_tag_path']})")
+                print(f"  {i+1}. {finding.message} (Value: '{finding.problematic_value}' at {finding.element_tag_path})")
         else:
             print("No format issues found in standalone test.")
     else:
@@ -12,7 +12,7 @@ import traceback # To allow printing full traceback for debugging
 
 from config_loader import load_config
 from gedcom_parser import parse_gedcom
-from analysis_modules import validate_formats # Uses __init__.py in analysis_modules
+from analysis_modules import validate_formats, validate_formats_parallel # Uses __init__.py in analysis_modules
 from reporting import generate_report # Uses __init__.py in reporting
 
 def main():
@@ -28,6 +28,8 @@ def main():
                         help="Path to the JSON configuration file.")
     parser.add_argument("-o", "--output", default="genealogy_analysis_report.txt",
                         help="Path for the output analysis report file.")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="Number of worker processes for analysis (1 = sequential).")
     args = parser.parse_args()
 
     print("--- Genealogy Data Quality Assistant ---")
@@ -56,7 +58,12 @@ def main():
     # 3. Execute Analysis Modules
     print("\nRunning Format Validator...")
     try:
-        format_issues = validate_formats(gedcom_data_reader, config)
+        # The validators yield findings lazily; materialize here because the
+        # CLI reports per-module counts before generating the report.
+        if args.jobs > 1:
+            format_issues = list(validate_formats_parallel(args.gedcom_file, config, max_workers=args.jobs))
+        else:
+            format_issues = list(validate_formats(gedcom_data_reader, config))
         if format_issues: # Only extend if there are issues
             all_findings.extend(format_issues)
             print(f"Format Validator found {len(format_issues)} issue(s).")
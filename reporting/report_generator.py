@@ -1,51 +1,62 @@
 import datetime
 import os
+from collections import defaultdict
+from pathlib import Path
 
 def generate_report(findings, gedcom_file_path, config_file_path, output_path="genealogy_analysis_report.txt"):
     """
     Generates a simple text report from the analysis findings.
 
     Args:
-        findings (list): A list of finding dictionaries.
+        findings: An iterable of Finding objects (see
+            analysis_modules.format_validator); generators are consumed in
+            a single pass, so streaming validators can be passed directly.
         gedcom_file_path (str): Path to the analyzed GEDCOM file.
         config_file_path (str): Path to the configuration file used.
         output_path (str): The path where the report will be saved.
     """
     try:
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write("--- Genealogy Data Quality Analysis Report ---\n")
-            f.write(f"Report generated on: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Analyzed GEDCOM file: {os.path.abspath(gedcom_file_path)}\n")
-            f.write(f"Configuration file used: {os.path.abspath(config_file_path)}\n")
-            f.write("=" * 60 + "\n\n")
+        # Build the entire report in memory and write it out in one go;
+        # a single os.write beats a stream of small buffered writes.
+        lines = [
+            "--- Genealogy Data Quality Analysis Report ---\n",
+            f"Report generated on: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+            f"Analyzed GEDCOM file: {os.path.abspath(gedcom_file_path)}\n",
+            f"Configuration file used: {os.path.abspath(config_file_path)}\n",
+            "=" * 60 + "\n\n",
+        ]
 
-            if not findings:
-                f.write("No issues found during the analysis.\n")
-            else:
-                f.write(f"Total issues found: {len(findings)}\n\n")
-                
-                findings_by_type = {}
-                for finding in findings:
-                    issue_type = finding.get("issue_type", "Unknown Issue Type")
-                    findings_by_type.setdefault(issue_type, []).append(finding)
-                
-                for issue_type, type_findings in findings_by_type.items():
-                    f.write(f"--- {issue_type.upper()} ({len(type_findings)} issue(s)) ---\n")
-                    for i, finding in enumerate(type_findings):
-                        f.write(f"  Issue {i+1}:\n")
-                        f.write(f"    Record Type:       {finding.get('record_type', 'N/A')}\n")
-                        f.write(f"    XREF ID:           {finding.get('element_xref_id', 'N/A')}\n")
-                        f.write(f"    Tag Path:          {finding.get('element_tag_path', 'N/A')}\n")
-                        f.write(f"    Problematic Value: '{finding.get('problematic_value', 'N/A')}'\n")
-                        f.write(f"    Message:           {finding.get('message', 'N/A')}\n")
-                        if finding.get('rule_violated'):
-                            f.write(f"    Rule Violated:     {finding.get('rule_violated')}\n")
-                        if finding.get('suggestion'):
-                            f.write(f"    Suggestion:        {finding.get('suggestion')}\n")
-                        f.write("-" * 20 + "\n")
-                    f.write("\n")
-            
-            print(f"Report successfully generated: {os.path.abspath(output_path)}")
+        # Single pass over the findings iterable: group by issue type and
+        # count as we go, so a generator works as well as a list.
+        findings_by_type = defaultdict(list)
+        total_findings = 0
+        for finding in findings:
+            findings_by_type[finding.issue_type or "Unknown Issue Type"].append(finding)
+            total_findings += 1
+
+        if not total_findings:
+            lines.append("No issues found during the analysis.\n")
+        else:
+            lines.append(f"Total issues found: {total_findings}\n\n")
+
+            for issue_type, type_findings in findings_by_type.items():
+                lines.append(f"--- {issue_type.upper()} ({len(type_findings)} issue(s)) ---\n")
+                for i, finding in enumerate(type_findings):
+                    lines.append(f"  Issue {i+1}:\n")
+                    lines.append(f"    Record Type:       {finding.record_type or 'N/A'}\n")
+                    lines.append(f"    XREF ID:           {finding.element_xref_id or 'N/A'}\n")
+                    lines.append(f"    Tag Path:          {finding.element_tag_path or 'N/A'}\n")
+                    lines.append(f"    Problematic Value: '{finding.problematic_value or 'N/A'}'\n")
+                    lines.append(f"    Message:           {finding.message or 'N/A'}\n")
+                    if finding.rule_violated:
+                        lines.append(f"    Rule Violated:     {finding.rule_violated}\n")
+                    if finding.suggestion:
+                        lines.append(f"    Suggestion:        {finding.suggestion}\n")
+                    lines.append("-" * 20 + "\n")
+                lines.append("\n")
+
+        Path(output_path).write_text("".join(lines), encoding='utf-8')
+        print(f"Report successfully generated: {os.path.abspath(output_path)}")
 
     except IOError as e:
         print(f"Error writing report to {os.path.abspath(output_path)}: {e}")
@@ -54,12 +65,18 @@ def generate_report(findings, gedcom_file_path, config_file_path, output_path="g
 
 if __name__ == '__main__':
     print("--- Testing Report Generator Standalone ---")
+    import sys
+    current_script_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.abspath(os.path.join(current_script_dir, os.pardir))
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
+    from analysis_modules.format_validator import Finding
+
     dummy_findings = [
-        {"issue_type": "Format Error", "record_type": "Individual", "element_xref_id": "@I1@",
-         "element_tag_path": "INDI:@I1@/BIRT/DATE", "problematic_value": "JAN 1 1900",
-         "message": "Date format error.", "suggestion": "Use DD MON YYYY."},
-        {"issue_type": "Missing Info", "record_type": "Family", "element_xref_id": "@F1@",
-         "element_tag_path": "FAM:@F1@/MARR", "problematic_value": "", "message": "Marriage event missing."}
+        Finding("Format Error", "Individual", "@I1@", "INDI:@I1@/BIRT/DATE",
+                "JAN 1 1900", "Date format error.", suggestion="Use DD MON YYYY."),
+        Finding("Missing Info", "Family", "@F1@", "FAM:@F1@/MARR",
+                "", "Marriage event missing.")
     ]
     test_output = "standalone_report_test.txt"
     generate_report(dummy_findings, "dummy.ged", "dummy_config.json", test_output)